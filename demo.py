@@ -4,12 +4,6 @@ Demo script for the Wordle game.
 This script demonstrates the core functionality of the Wordle game.
 """
 
-import sys
-import os
-
-# Add the wordle package to the path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'wordle'))
-
 from wordle.word_list import WordList
 from wordle.utils import calculate_guess_result, print_guess_result
 
@@ -4,12 +4,6 @@ Wordle Game - Main Entry Point
 A Python implementation of the popular Wordle word guessing game.
 """
 
-import sys
-import os
-
-# Add the wordle package to the path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'wordle'))
-
 from wordle.game import WordleGame
 from wordle.word_scraper import WordScraper
 from wordle.utils import print_welcome, print_goodbye
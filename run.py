@@ -7,24 +7,26 @@ This script provides an easy way to start the game and handle any setup.
 import sys
 import os
 import subprocess
+import importlib
+import importlib.util
 
 def check_dependencies():
     """Check if required dependencies are installed."""
-    try:
-        import requests
-        import bs4
-        import colorama
-        return True
-    except ImportError as e:
-        print(f"❌ Missing dependency: {e}")
+    # find_spec locates the modules without running their import-time code
+    missing = [name for name in ("requests", "bs4", "lxml", "colorama") if importlib.util.find_spec(name) is None]
+    if missing:
+        print(f"❌ Missing dependency: {', '.join(missing)}")
         print("Please install dependencies with: pip install -r requirements.txt")
         return False
+    return True
 
 def install_dependencies():
     """Install required dependencies."""
     print("📦 Installing dependencies...")
     try:
         subprocess.check_call([sys.executable, "-m", "pip", "install", "-r", "requirements.txt"])
+        # Let the next check see packages that were just installed
+        importlib.invalidate_caches()
         print("✅ Dependencies installed successfully!")
         return True
     except subprocess.CalledProcessError:
@@ -5,10 +5,6 @@ This script tests the word scraper to ensure it can properly scrape words from t
 """
 
 import sys
-import os
-
-# Add the wordle package to the path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'wordle'))
 
 from wordle.word_scraper import WordScraper
 
@@ -5,12 +5,20 @@ Test cases for the Wordle game.
 import unittest
 import sys
 import os
+import io
+import tempfile
+from contextlib import redirect_stdout
+from unittest import mock
 
 # Add the parent directory to the path to import the wordle package
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 from wordle.word_list import WordList
-from wordle.utils import validate_guess, calculate_guess_result, update_used_letters
+from wordle.game import WordleGame
+from wordle.utils import (
+    validate_guess, calculate_guess_result, update_used_letters, score_guess, decode_feedback,
+    format_game_board, format_keyboard_hint, print_game_screen, _fast_write
+)
 
 
 class TestWordList(unittest.TestCase):
@@ -56,6 +64,14 @@ class TestWordList(unittest.TestCase):
         expected = ["about", "above", "abuse"]
         self.assertEqual(set(words), set(expected))
     
+    def test_words_starting_with_edges(self):
+        """Test prefix lookups at the ends of the alphabet."""
+        word_list = WordList(["zebra", "zesty", "zonal", "about"])
+        self.assertEqual(word_list.get_words_starting_with("z"), ["zebra", "zesty", "zonal"])
+        self.assertEqual(word_list.get_words_starting_with("zonal"), ["zonal"])
+        self.assertEqual(word_list.get_words_starting_with("zonals"), [])
+        self.assertEqual(len(word_list.get_words_starting_with("")), 4)
+    
     def test_words_containing_letter(self):
         """Test finding words containing a letter."""
         words = self.word_list.get_words_containing_letter("x")
@@ -72,6 +88,37 @@ class TestWordList(unittest.TestCase):
         words = self.word_list.get_words_with_pattern("?????")
         self.assertEqual(len(words), len(self.test_words))
     
+    def test_words_with_pattern_offsets(self):
+        """Test pattern scans over slices of the joined word text."""
+        # Fixed prefixes that start partway through the sorted list
+        self.assertEqual(self.word_list.get_words_with_pattern("ab?ve"), ["above"])
+        self.assertEqual(self.word_list.get_words_with_pattern("abo?t"), ["about"])
+        self.assertEqual(self.word_list.get_words_with_pattern("al??e"), ["alike", "alive", "alone"])
+        # Leading wildcard scans the whole text
+        self.assertEqual(self.word_list.get_words_with_pattern("?b?ut"), ["about"])
+        # The last word ends at the end of the text
+        self.assertEqual(self.word_list.get_words_with_pattern("an??r"), ["anger"])
+        self.assertEqual(self.word_list.get_words_with_pattern("???er"), ["after", "alter", "anger"])
+        # Patterns are case-insensitive
+        self.assertEqual(self.word_list.get_words_with_pattern("A??UT"), ["about"])
+    
+    def test_score_all(self):
+        """Test scoring a guess against the whole list."""
+        codes = self.word_list.score_all("about")
+        self.assertEqual(len(codes), len(self.test_words))
+        self.assertEqual(decode_feedback(codes[0]), ["correct"] * 5)
+        self.assertEqual(decode_feedback(codes[1]), calculate_guess_result("about", "above"))
+    
+    def test_get_feedback(self):
+        """Test feedback lookups match direct scoring."""
+        for answer in ["about", "alike", "anger"]:
+            self.assertEqual(self.word_list.get_feedback("alarm", answer), score_guess("alarm", answer))
+        # Answers outside the list are scored directly
+        self.assertEqual(self.word_list.get_feedback("alarm", "zebra"), score_guess("alarm", "zebra"))
+        # Guesses outside the list are scored directly without caching a row
+        self.assertEqual(self.word_list.get_feedback("zebra", "about"), score_guess("zebra", "about"))
+        self.assertNotIn("zebra", self.word_list._feedback)
+    
     def test_word_frequency(self):
         """Test letter frequency calculation."""
         frequency = self.word_list.get_word_frequency()
@@ -152,6 +199,44 @@ class TestUtils(unittest.TestCase):
         expected = ["correct", "correct", "not_in_word", "not_in_word", "not_in_word"]
         self.assertEqual(result, expected)
     
+    def test_score_guess_packing(self):
+        """Test packed feedback codes round-trip through decode_feedback."""
+        self.assertEqual(score_guess("about", "about"), 0b1010101010)
+        self.assertEqual(score_guess("xxxxx", "about"), 0)
+        self.assertEqual(decode_feedback(score_guess("speed", "abide")),
+                         ["not_in_word", "not_in_word", "wrong_position", "not_in_word", "wrong_position"])
+    
+    def test_print_game_screen_redirected(self):
+        """Test the game screen written to a non-terminal stream."""
+        guesses = ["speed"]
+        results = [calculate_guess_result("speed", "abide")]
+        used_letters = update_used_letters("speed", results[0], {})
+        
+        out = io.StringIO()
+        with mock.patch("os.system") as system, redirect_stdout(out):
+            print_game_screen(guesses, results, used_letters)
+        
+        system.assert_called_once()
+        self.assertEqual(out.getvalue(), format_game_board(guesses, results) + format_keyboard_hint(used_letters))
+        self.assertNotIn("\x1b[?2026", out.getvalue())
+    
+    @unittest.skipIf(os.name == 'nt', "Frames are only written to the descriptor on POSIX")
+    def test_fast_write_terminal(self):
+        """Test frames written to a terminal descriptor arrive whole and in order."""
+        real_write = os.write
+        frame = "\x1b[36mGame Board:\x1b[0m 🎯\n  ___ ___\n"
+        
+        with tempfile.TemporaryFile("w+", encoding="utf-8") as stream:
+            with mock.patch.object(sys, "stdout", stream), \
+                 mock.patch.object(stream, "isatty", return_value=True), \
+                 mock.patch("os.write", side_effect=lambda fd, data: real_write(fd, bytes(data[:3]))) as write:
+                print("before")
+                _fast_write(frame)
+            
+            stream.seek(0)
+            self.assertEqual(stream.buffer.read(), ("before\n" + frame).encode("utf-8"))
+        self.assertGreater(write.call_count, 1)
+    
     def test_update_used_letters(self):
         """Test updating used letters dictionary."""
         used_letters = {}
@@ -192,6 +277,25 @@ class TestGameLogic(unittest.TestCase):
         self.assertTrue("about" in word_list)
         self.assertFalse("abc" in word_list)
         self.assertFalse("12345" in word_list)
+    
+    def test_statistics_round_trip(self):
+        """Test that saved statistics load back with int guess counts."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            stats_file = os.path.join(tmp_dir, "wordle_stats.json")
+            for _ in range(2):
+                game = WordleGame(["about", "above", "abuse"])
+                game.stats_file = stats_file
+                game.stats = game.load_statistics()
+                game.update_statistics(True, 1)
+            
+            stats = game.load_statistics()
+            self.assertEqual(stats['guess_distribution'][1], 2)
+            self.assertEqual(stats['games_won'], 2)
+            
+            # Each attempt count is written once, not as both "1" and 1
+            with open(stats_file) as f:
+                self.assertEqual(f.read().count('"1"'), 1)
+            self.assertFalse(os.path.exists(stats_file + ".tmp"))
 
 
 if __name__ == "__main__":
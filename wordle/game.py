@@ -9,10 +9,9 @@ import os
 from typing import List, Dict, Optional
 from .word_list import WordList
 from .utils import (
-    print_welcome, print_goodbye, print_guess_result, print_keyboard_hint,
-    print_game_board, print_win_message, print_lose_message, print_statistics,
-    get_user_input, validate_guess, calculate_guess_result, update_used_letters,
-    clear_screen
+    print_welcome, print_goodbye, print_guess_result, print_game_screen,
+    print_win_message, print_lose_message, print_statistics,
+    get_user_input, validate_guess, calculate_guess_result, update_used_letters
 )
 
 
@@ -34,6 +33,7 @@ class WordleGame:
         self.attempts = 0
         self.max_attempts = 6
         self.game_won = False
+        self._hint_cache = {}  # Pattern -> matching words for the current game
         self.stats_file = "data/wordle_stats.json"
         self.stats = self.load_statistics()
     
@@ -48,10 +48,15 @@ class WordleGame:
             if os.path.exists(self.stats_file):
                 with open(self.stats_file, 'r') as f:
                     stats = json.load(f)
-                    # Ensure all required keys exist
-                    if 'guess_distribution' not in stats:
-                        stats['guess_distribution'] = {1: 0, 2: 0, 3: 0, 4: 0, 5: 0, 6: 0}
-                    return stats
+                # Ensure all required keys exist
+                if 'guess_distribution' not in stats:
+                    stats['guess_distribution'] = {1: 0, 2: 0, 3: 0, 4: 0, 5: 0, 6: 0}
+                else:
+                    # JSON object keys are strings; attempts are counted by int
+                    stats['guess_distribution'] = {
+                        int(attempts): count for attempts, count in stats['guess_distribution'].items()
+                    }
+                return stats
         except Exception as e:
             print(f"⚠️  Could not load statistics: {e}")
         
@@ -66,12 +71,20 @@ class WordleGame:
     
     def save_statistics(self):
         """Save game statistics to file."""
+        # Write the whole file at once, then swap it in so a crash can't truncate it
+        tmp_file = self.stats_file + '.tmp'
         try:
             os.makedirs(os.path.dirname(self.stats_file), exist_ok=True)
-            with open(self.stats_file, 'w') as f:
-                json.dump(self.stats, f, indent=2)
+            with open(tmp_file, 'w') as f:
+                f.write(json.dumps(self.stats, indent=2))
+            os.replace(tmp_file, self.stats_file)
         except Exception as e:
             print(f"⚠️  Could not save statistics: {e}")
+            # Don't leave a partial temp file behind
+            try:
+                os.remove(tmp_file)
+            except OSError:
+                pass
     
     def update_statistics(self, won: bool, attempts: int):
         """
@@ -111,6 +124,7 @@ class WordleGame:
         self.used_letters = {}
         self.attempts = 0
         self.game_won = False
+        self._hint_cache = {}
         
         print(f"\n🎯 New game started! You have {self.max_attempts} attempts.")
         print(f"📝 Word list contains {self.word_list.get_word_count()} words.")
@@ -164,9 +178,7 @@ class WordleGame:
     
     def display_game_state(self):
         """Display the current game state."""
-        clear_screen()
-        print_game_board(self.guesses, self.results)
-        print_keyboard_hint(self.used_letters)
+        print_game_screen(self.guesses, self.results, self.used_letters)
     
     def play_round(self) -> bool:
         """
@@ -261,7 +273,10 @@ class WordleGame:
                 for pos, letter in known_letters:
                     pattern[pos] = letter
                 
-                matching_words = self.word_list.get_words_with_pattern(''.join(pattern))
+                pattern = ''.join(pattern)
+                if pattern not in self._hint_cache:
+                    self._hint_cache[pattern] = self.word_list.get_words_with_pattern(pattern)
+                matching_words = self._hint_cache[pattern]
                 if matching_words:
                     return f"Words matching current pattern: {', '.join(matching_words[:3])}"
             
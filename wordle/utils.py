@@ -4,11 +4,89 @@ Provides colored output and display functions.
 """
 
 import os
+import sys
 from colorama import init, Fore, Back, Style
 from typing import List, Tuple
 
-# Initialize colorama for cross-platform colored output
-init(autoreset=True)
+# colorama is only needed to translate ANSI codes on Windows and to strip them
+# from redirected output. A POSIX terminal takes the codes as they are, so skip
+# the stream wrappers that would otherwise sit in front of every write there.
+# Colored text always ends with an explicit reset, so autoreset is not relied on.
+if os.name == 'nt' or not sys.stdout.isatty():
+    init(autoreset=True)
+
+# Per-letter feedback codes, packed two bits per letter by score_guess
+NOT_IN_WORD, WRONG_POSITION, CORRECT = 0, 1, 2
+STATUS_NAMES = ('not_in_word', 'wrong_position', 'correct')
+STATUS_RANK = {name: code for code, name in enumerate(STATUS_NAMES)}
+ALL_CORRECT = sum(CORRECT << (2 * i) for i in range(5))
+
+# Cell colors for each status, concatenated once instead of per cell
+STATUS_COLORS = {
+    'correct': Back.GREEN + Fore.BLACK,
+    'wrong_position': Back.YELLOW + Fore.BLACK,
+    'not_in_word': Back.WHITE + Fore.BLACK,
+}
+COLOR_RESET = Style.RESET_ALL
+
+KEYBOARD_LAYOUT = (
+    "QWERTYUIOP",
+    " ASDFGHJKL ",
+    "  ZXCVBNM   "
+)
+
+# DEC private mode 2026: terminals hold rendering until the frame is complete
+SYNC_OUTPUT_BEGIN = "\x1b[?2026h"
+SYNC_OUTPUT_END = "\x1b[?2026l"
+
+# Home the cursor and erase everything below it
+CLEAR_SCREEN = "\x1b[H\x1b[J"
+
+
+def _synchronized(frame: str) -> str:
+    """
+    Wrap a frame in synchronized output markers when writing to a terminal.
+    
+    Terminals without mode 2026 ignore the markers. Legacy Windows consoles
+    would print them through colorama, so they are skipped there.
+    
+    Args:
+        frame (str): The text to display as one update
+        
+    Returns:
+        str: The frame, wrapped if the markers apply
+    """
+    if os.name != 'nt' and sys.stdout.isatty():
+        return SYNC_OUTPUT_BEGIN + frame + SYNC_OUTPUT_END
+    return frame
+
+
+def _fast_write(text: str):
+    """
+    Write text to stdout, going straight to the file descriptor on a terminal.
+    
+    A POSIX terminal has no colorama wrapper in front of stdout, so the frame
+    is encoded once and handed to os.write. Anything else (Windows consoles,
+    redirected or captured output, streams without a descriptor) goes through
+    sys.stdout.write as before.
+    
+    Args:
+        text (str): The text to write
+    """
+    stream = sys.stdout
+    if os.name != 'nt' and stream.isatty():
+        try:
+            fd = stream.fileno()
+        except (AttributeError, OSError, ValueError):
+            fd = None
+        if fd is not None:
+            # Keep anything already printed ahead of the frame
+            stream.flush()
+            data = memoryview(text.encode(stream.encoding or 'utf-8', stream.errors or 'strict'))
+            while data:
+                data = data[os.write(fd, data):]
+            return
+    stream.write(text)
 
 
 def print_welcome():
@@ -16,7 +94,7 @@ def print_welcome():
     print("\n" + "=" * 50)
     print(f"{Fore.CYAN}{Style.BRIGHT}🎯 WELCOME TO WORDLE! 🎯{Style.RESET_ALL}")
     print("=" * 50)
-    print(f"{Fore.YELLOW}Guess the 5-letter word in 6 attempts!")
+    print(f"{Fore.YELLOW}Guess the 5-letter word in 6 attempts!{Style.RESET_ALL}")
     print("After each guess, you'll see:")
     print(f"{Fore.GREEN}🟩 Green{Style.RESET_ALL} - Letter is correct and in the right position")
     print(f"{Fore.YELLOW}🟨 Yellow{Style.RESET_ALL} - Letter is correct but in the wrong position")
@@ -29,6 +107,23 @@ def print_goodbye():
     print(f"\n{Fore.CYAN}Thanks for playing Wordle! 👋{Style.RESET_ALL}")
 
 
+def format_guess_result(guess: str, result: List[str]) -> str:
+    """
+    Format the result of a guess as a line of colored squares.
+    
+    Args:
+        guess (str): The guessed word
+        result (List[str]): List of result indicators ('correct', 'wrong_position', 'not_in_word')
+        
+    Returns:
+        str: The formatted line, without a trailing newline
+    """
+    parts = ["  "]
+    for letter, status in zip(guess.upper(), result):
+        parts.append(STATUS_COLORS[status] + " " + letter + " " + COLOR_RESET + " ")
+    return "".join(parts)
+
+
 def print_guess_result(guess: str, result: List[str]):
     """
     Print the result of a guess with colored squares.
@@ -37,15 +132,38 @@ def print_guess_result(guess: str, result: List[str]):
         guess (str): The guessed word
         result (List[str]): List of result indicators ('correct', 'wrong_position', 'not_in_word')
     """
-    print("  ", end="")
-    for i, (letter, status) in enumerate(zip(guess.upper(), result)):
-        if status == 'correct':
-            print(f"{Back.GREEN}{Fore.BLACK} {letter} {Style.RESET_ALL}", end=" ")
-        elif status == 'wrong_position':
-            print(f"{Back.YELLOW}{Fore.BLACK} {letter} {Style.RESET_ALL}", end=" ")
-        else:  # not_in_word
-            print(f"{Back.WHITE}{Fore.BLACK} {letter} {Style.RESET_ALL}", end=" ")
-    print()
+    _fast_write(format_guess_result(guess, result) + "\n")
+
+
+def _key_cell(key: str, used_letters: dict) -> str:
+    """
+    Format one keyboard key, colored by its status if it has been used.
+    
+    Args:
+        key (str): Uppercase letter or layout space
+        used_letters (dict): Dictionary with letter status
+        
+    Returns:
+        str: The key as it should appear on the keyboard
+    """
+    status = used_letters.get(key)
+    if status is None:
+        return key
+    return STATUS_COLORS[status] + key + COLOR_RESET
+
+
+def format_keyboard_hint(used_letters: dict) -> str:
+    """
+    Format a keyboard hint showing used letters.
+    
+    Args:
+        used_letters (dict): Dictionary with letter status ('correct', 'wrong_position', 'not_in_word')
+        
+    Returns:
+        str: The keyboard hint, ending with a newline
+    """
+    rows = ["  " + "".join(_key_cell(key, used_letters) for key in row) for row in KEYBOARD_LAYOUT]
+    return f"\n{Fore.CYAN}Keyboard:{Style.RESET_ALL}\n" + "\n".join(rows) + "\n"
 
 
 def print_keyboard_hint(used_letters: dict):
@@ -55,48 +173,60 @@ def print_keyboard_hint(used_letters: dict):
     Args:
         used_letters (dict): Dictionary with letter status ('correct', 'wrong_position', 'not_in_word')
     """
-    keyboard_layout = [
-        "QWERTYUIOP",
-        " ASDFGHJKL ",
-        "  ZXCVBNM   "
-    ]
-    
-    print(f"\n{Fore.CYAN}Keyboard:{Style.RESET_ALL}")
-    for row in keyboard_layout:
-        print("  ", end="")
-        for letter in row:
-            if letter == " ":
-                print(" ", end="")
-            elif letter in used_letters:
-                status = used_letters[letter]
-                if status == 'correct':
-                    print(f"{Back.GREEN}{Fore.BLACK}{letter}{Style.RESET_ALL}", end="")
-                elif status == 'wrong_position':
-                    print(f"{Back.YELLOW}{Fore.BLACK}{letter}{Style.RESET_ALL}", end="")
-                else:  # not_in_word
-                    print(f"{Back.WHITE}{Fore.BLACK}{letter}{Style.RESET_ALL}", end="")
-            else:
-                print(f"{letter}", end="")
-        print()
+    _fast_write(_synchronized(format_keyboard_hint(used_letters)))
 
 
-def print_game_board(guesses: List[str], results: List[List[str]]):
+def format_game_board(guesses: List[str], results: List[List[str]]) -> str:
     """
-    Print the game board with all previous guesses.
+    Format the game board with all previous guesses.
     
     Args:
         guesses (List[str]): List of previous guesses
         results (List[List[str]]): List of result lists for each guess
+        
+    Returns:
+        str: The game board, ending with a newline
     """
-    print(f"\n{Fore.CYAN}Game Board:{Style.RESET_ALL}")
-    print("  " + "-" * 25)
+    lines = [f"\n{Fore.CYAN}Game Board:{Style.RESET_ALL}", "  " + "-" * 25]
     
     for i in range(6):
         if i < len(guesses):
-            print_guess_result(guesses[i], results[i])
+            lines.append(format_guess_result(guesses[i], results[i]))
         else:
-            print("  " + " ___ " * 5)
-    print("  " + "-" * 25)
+            lines.append("  " + " ___ " * 5)
+    lines.append("  " + "-" * 25)
+    return "\n".join(lines) + "\n"
+
+
+def print_game_board(guesses: List[str], results: List[List[str]]):
+    """
+    Print the game board with all previous guesses.
+    
+    Args:
+        guesses (List[str]): List of previous guesses
+        results (List[List[str]]): List of result lists for each guess
+    """
+    _fast_write(_synchronized(format_game_board(guesses, results)))
+
+
+def print_game_screen(guesses: List[str], results: List[List[str]], used_letters: dict):
+    """
+    Clear the screen and print the game board and keyboard hint.
+    
+    On a terminal the clear, board and keyboard go out as one synchronized
+    frame, so the cleared screen is never painted on its own.
+    
+    Args:
+        guesses (List[str]): List of previous guesses
+        results (List[List[str]]): List of result lists for each guess
+        used_letters (dict): Dictionary with letter status ('correct', 'wrong_position', 'not_in_word')
+    """
+    frame = format_game_board(guesses, results) + format_keyboard_hint(used_letters)
+    if sys.stdout.isatty():
+        _fast_write(_synchronized(CLEAR_SCREEN + frame))
+    else:
+        clear_screen()
+        _fast_write(frame)
 
 
 def print_win_message(attempts: int):
@@ -107,7 +237,7 @@ def print_win_message(attempts: int):
         attempts (int): Number of attempts taken
     """
     print(f"\n{Fore.GREEN}{Style.BRIGHT}🎉 CONGRATULATIONS! 🎉{Style.RESET_ALL}")
-    print(f"{Fore.GREEN}You guessed the word in {attempts} {'attempt' if attempts == 1 else 'attempts'}!")
+    print(f"{Fore.GREEN}You guessed the word in {attempts} {'attempt' if attempts == 1 else 'attempts'}!{Style.RESET_ALL}")
     
     # Add some fun messages based on attempts
     if attempts == 1:
@@ -130,7 +260,7 @@ def print_lose_message(correct_word: str):
         correct_word (str): The correct word that wasn't guessed
     """
     print(f"\n{Fore.RED}{Style.BRIGHT}😔 GAME OVER! 😔{Style.RESET_ALL}")
-    print(f"{Fore.RED}You ran out of attempts!")
+    print(f"{Fore.RED}You ran out of attempts!{Style.RESET_ALL}")
     print(f"The correct word was: {Fore.YELLOW}{Style.BRIGHT}{correct_word.upper()}{Style.RESET_ALL}")
     print(f"{Fore.CYAN}Better luck next time! 💪{Style.RESET_ALL}")
 
@@ -143,37 +273,41 @@ def print_statistics(stats: dict):
         stats (dict): Dictionary containing game statistics
     """
     try:
-        print(f"\n{Fore.CYAN}{Style.BRIGHT}📊 GAME STATISTICS 📊{Style.RESET_ALL}")
-        print("=" * 30)
+        lines = [f"\n{Fore.CYAN}{Style.BRIGHT}📊 GAME STATISTICS 📊{Style.RESET_ALL}", "=" * 30]
         
         if 'games_played' in stats:
-            print(f"Games Played: {stats['games_played']}")
+            lines.append(f"Games Played: {stats['games_played']}")
         
         if 'games_won' in stats:
             win_rate = (stats['games_won'] / stats['games_played']) * 100 if stats['games_played'] > 0 else 0
-            print(f"Games Won: {stats['games_won']} ({win_rate:.1f}%)")
+            lines.append(f"Games Won: {stats['games_won']} ({win_rate:.1f}%)")
         
         if 'current_streak' in stats:
-            print(f"Current Streak: {stats['current_streak']}")
+            lines.append(f"Current Streak: {stats['current_streak']}")
         
         if 'max_streak' in stats:
-            print(f"Max Streak: {stats['max_streak']}")
+            lines.append(f"Max Streak: {stats['max_streak']}")
         
         if 'guess_distribution' in stats:
-            print(f"\n{Fore.YELLOW}Guess Distribution:{Style.RESET_ALL}")
+            lines.append(f"\n{Fore.YELLOW}Guess Distribution:{Style.RESET_ALL}")
             for i in range(1, 7):
                 count = stats['guess_distribution'].get(i, 0)
                 bar = "█" * count if count > 0 else "░"
-                print(f"{i}: {bar} {count}")
+                lines.append(f"{i}: {bar} {count}")
         
-        print("=" * 30)
+        lines.append("=" * 30)
+        _fast_write(_synchronized("\n".join(lines) + "\n"))
     except Exception as e:
         print(f"⚠️  Could not display statistics: {e}")
 
 
 def clear_screen():
     """Clear the terminal screen."""
-    os.system('cls' if os.name == 'nt' else 'clear')
+    if sys.stdout.isatty():
+        # Home the cursor and erase below it instead of spawning a shell per redraw
+        print(CLEAR_SCREEN, end="")
+    else:
+        os.system('cls' if os.name == 'nt' else 'clear')
 
 
 def get_user_input(prompt: str) -> str:
@@ -209,46 +343,78 @@ def validate_guess(guess: str, word_list) -> Tuple[bool, str]:
     if not guess.isalpha():
         return False, "Word must contain only letters."
     
-    if not word_list.is_valid_word(guess):
+    # Length and letters are already checked, so skip is_valid_word's re-validation
+    if not word_list.contains_normalized(guess.lower()):
         return False, "Word not found in the word list."
     
     return True, ""
 
 
-def calculate_guess_result(guess: str, target_word: str) -> List[str]:
+def score_guess(guess: str, target_word: str) -> int:
     """
-    Calculate the result of a guess against the target word.
+    Score a guess against the target word as a packed feedback code.
+    
+    Letter i occupies bits 2*i and 2*i + 1 and holds NOT_IN_WORD,
+    WRONG_POSITION or CORRECT.
     
     Args:
         guess (str): The guessed word
         target_word (str): The target word
         
     Returns:
-        List[str]: List of result indicators
+        int: Packed feedback code
     """
-    result = ['not_in_word'] * 5
-    target_letters = list(target_word)
-    guess_letters = list(guess)
+    if guess == target_word:
+        return ALL_CORRECT
     
-    # First pass: mark correct letters
-    for i in range(5):
-        if guess_letters[i] == target_letters[i]:
-            result[i] = 'correct'
-            target_letters[i] = None  # Mark as used
-            guess_letters[i] = None   # Mark as used
+    code = 0
+    counts = {}  # Unmatched target letters and how many copies remain
+    unmatched = []
     
-    # Second pass: mark wrong position letters
+    # First pass: mark correct letters and tally the rest of the target
     for i in range(5):
-        if guess_letters[i] is not None:
-            if guess_letters[i] in target_letters:
-                result[i] = 'wrong_position'
-                # Remove the first occurrence of this letter from target
-                for j in range(5):
-                    if target_letters[j] == guess_letters[i]:
-                        target_letters[j] = None
-                        break
+        letter = target_word[i]
+        if guess[i] == letter:
+            code |= CORRECT << (2 * i)
+        else:
+            counts[letter] = counts.get(letter, 0) + 1
+            unmatched.append(i)
+    
+    # Second pass: mark wrong position letters while target copies remain
+    for i in unmatched:
+        letter = guess[i]
+        if counts.get(letter):
+            counts[letter] -= 1
+            code |= WRONG_POSITION << (2 * i)
+    
+    return code
+
+
+def decode_feedback(code: int) -> List[str]:
+    """
+    Expand a packed feedback code into result indicators.
+    
+    Args:
+        code (int): Packed feedback code from score_guess
+        
+    Returns:
+        List[str]: List of result indicators
+    """
+    return [STATUS_NAMES[(code >> (2 * i)) & 3] for i in range(5)]
+
+
+def calculate_guess_result(guess: str, target_word: str) -> List[str]:
+    """
+    Calculate the result of a guess against the target word.
     
-    return result
+    Args:
+        guess (str): The guessed word
+        target_word (str): The target word
+        
+    Returns:
+        List[str]: List of result indicators
+    """
+    return decode_feedback(score_guess(guess, target_word))
 
 
 def update_used_letters(guess: str, result: List[str], used_letters: dict) -> dict:
@@ -264,12 +430,9 @@ def update_used_letters(guess: str, result: List[str], used_letters: dict) -> di
         dict: Updated used letters dictionary
     """
     for letter, status in zip(guess.upper(), result):
-        if letter not in used_letters:
+        # Keep the best status seen so far (correct > wrong_position > not_in_word)
+        current_status = used_letters.get(letter)
+        if current_status is None or STATUS_RANK[status] > STATUS_RANK[current_status]:
             used_letters[letter] = status
-        else:
-            # Upgrade status if current is better (correct > wrong_position > not_in_word)
-            current_status = used_letters[letter]
-            if status == 'correct' or (status == 'wrong_position' and current_status == 'not_in_word'):
-                used_letters[letter] = status
     
     return used_letters 
\ No newline at end of file
@@ -3,13 +3,37 @@ Word List Module
 Manages the list of valid 5-letter words and provides word validation.
 """
 
-from typing import List, Set, Optional
+from typing import Callable, List, Set, Optional, Tuple
+from array import array
+from bisect import bisect_left
+from collections import Counter
+from functools import lru_cache
 import random
+import re
+import sys
+from .utils import score_guess
+
+
+@lru_cache(maxsize=64)
+def _compile_pattern(pattern: str) -> Callable:
+    """
+    Compile a '?' wildcard pattern into a scanner over newline-separated words.
+    
+    Args:
+        pattern (str): Lowercase pattern (e.g., "a??le")
+        
+    Returns:
+        Callable: The compiled regex's findall method
+    """
+    regex = ''.join('.' if char == '?' else re.escape(char) for char in pattern)
+    return re.compile('^' + regex + '$', re.MULTILINE).findall
 
 
 class WordList:
     """Manages a list of valid 5-letter words for the Wordle game."""
     
+    __slots__ = ('words', 'word_set', '_sorted', '_text', '_letter_counts', '_common_letters', '_index', '_feedback')
+    
     def __init__(self, words: List[str]):
         """
         Initialize the word list.
@@ -17,9 +41,17 @@ class WordList:
         Args:
             words (List[str]): List of 5-letter words
         """
-        self.words = [word.lower().strip() for word in words if self._is_valid_word(word)]
-        self.word_set = set(self.words)
-        self._validate_word_list()
+        self.words = tuple(sys.intern(word.lower().strip()) for word in words if self._is_valid_word(word))
+        self.word_set = frozenset(self.words)
+        self._sorted = sorted(self.words)
+        # Sorted words joined by newlines; word i starts at offset 6 * i
+        self._text = '\n'.join(self._sorted)
+        # The list never changes after construction, so count letters once
+        self._letter_counts = Counter(''.join(self.words))
+        self._common_letters = self._letter_counts.most_common()
+        self._index = {word: i for i, word in enumerate(self.words)}
+        # Feedback table rows (guess -> codes against every word), filled on demand
+        self._feedback = {}
     
     def _is_valid_word(self, word: str) -> bool:
         """
@@ -37,15 +69,6 @@ class WordList:
         word = word.lower().strip()
         return len(word) == 5 and word.isalpha()
     
-    def _validate_word_list(self):
-        """Validate the word list and remove invalid words."""
-        original_count = len(self.words)
-        self.words = [word for word in self.words if self._is_valid_word(word)]
-        self.word_set = set(self.words)
-        
-        if len(self.words) != original_count:
-            print(f"⚠️  Removed {original_count - len(self.words)} invalid words from the list")
-    
     def get_random_word(self) -> Optional[str]:
         """
         Get a random word from the list.
@@ -67,9 +90,24 @@ class WordList:
         Returns:
             bool: True if word is valid, False otherwise
         """
-        if not self._is_valid_word(word):
+        if not isinstance(word, str):
             return False
-        return word.lower().strip() in self.word_set
+        
+        # The set only holds normalized 5-letter words, so membership is the whole check
+        word = word.strip()
+        return len(word) == 5 and word.lower() in self.word_set
+    
+    def contains_normalized(self, word: str) -> bool:
+        """
+        Check if an already lowercased, stripped word is in the list.
+        
+        Args:
+            word (str): Normalized word to check
+            
+        Returns:
+            bool: True if the word is in the list, False otherwise
+        """
+        return word in self.word_set
     
     def get_word_count(self) -> int:
         """
@@ -90,8 +128,26 @@ class WordList:
         Returns:
             List[str]: List of words starting with the prefix
         """
-        prefix = prefix.lower()
-        return [word for word in self.words if word.startswith(prefix)]
+        start, end = self._prefix_range(prefix.lower())
+        return self._sorted[start:end]
+    
+    def _prefix_range(self, prefix: str) -> Tuple[int, int]:
+        """
+        Find the slice of the sorted list holding words with a prefix.
+        
+        Args:
+            prefix (str): Lowercase prefix
+            
+        Returns:
+            Tuple[int, int]: Start and end indexes into the sorted list
+        """
+        if not prefix:
+            return 0, len(self._sorted)
+        
+        # Matches form one contiguous run of the sorted list
+        upper = prefix[:-1] + chr(ord(prefix[-1]) + 1)
+        start = bisect_left(self._sorted, prefix)
+        return start, bisect_left(self._sorted, upper, start)
     
     def get_words_containing_letter(self, letter: str) -> List[str]:
         """
@@ -120,22 +176,66 @@ class WordList:
             return []
         
         pattern = pattern.lower()
-        matching_words = []
         
-        for word in self.words:
-            if len(word) != 5:
-                continue
+        # Fixed leading letters narrow the search to a sorted slice
+        prefix = pattern.split('?', 1)[0]
+        start, end = self._prefix_range(prefix)
+        if not pattern[len(prefix):].strip('?'):
+            return self._sorted[start:end]
+        
+        # Scan that slice of the joined text with one compiled regex
+        scan = _compile_pattern(pattern)
+        return scan(self._text, 6 * start, 6 * end)
+    
+    def score_all(self, guess: str) -> List[int]:
+        """
+        Score a guess against every word in the list.
+        
+        Args:
+            guess (str): The guessed word
             
-            match = True
-            for i, char in enumerate(pattern):
-                if char != '?' and word[i] != char:
-                    match = False
-                    break
+        Returns:
+            List[int]: Packed feedback codes (see utils.score_guess), in list order
+        """
+        return self._feedback_row(guess.lower()).tolist()
+    
+    def get_feedback(self, guess: str, answer: str) -> int:
+        """
+        Look up the packed feedback code for a guess against an answer.
+        
+        For a guess in the list, the first lookup scores it against the
+        whole list and later lookups are a single index. Other guesses are
+        scored directly and not cached.
+        
+        Args:
+            guess (str): The guessed word
+            answer (str): The answer to score against
             
-            if match:
-                matching_words.append(word)
+        Returns:
+            int: Packed feedback code (see utils.score_guess)
+        """
+        guess = guess.lower()
+        answer = answer.lower()
+        index = self._index.get(answer)
+        if index is None or guess not in self._index:
+            return score_guess(guess, answer)
+        return self._feedback_row(guess)[index]
+    
+    def _feedback_row(self, guess: str) -> array:
+        """
+        Get the cached feedback codes for a guess, computing them if needed.
         
-        return matching_words
+        Args:
+            guess (str): Lowercase guessed word
+            
+        Returns:
+            array: Unsigned 16-bit codes, one per word in list order
+        """
+        row = self._feedback.get(guess)
+        if row is None:
+            row = array('H', [score_guess(guess, word) for word in self.words])
+            self._feedback[guess] = row
+        return row
     
     def get_sample_words(self, count: int = 10) -> List[str]:
         """
@@ -148,7 +248,7 @@ class WordList:
             List[str]: Sample of words
         """
         if count >= len(self.words):
-            return self.words.copy()
+            return list(self.words)
         return random.sample(self.words, count)
     
     def get_word_frequency(self) -> dict:
@@ -158,11 +258,7 @@ class WordList:
         Returns:
             dict: Dictionary with letter frequencies
         """
-        frequency = {}
-        for word in self.words:
-            for letter in word:
-                frequency[letter] = frequency.get(letter, 0) + 1
-        return frequency
+        return dict(self._letter_counts)
     
     def get_most_common_letters(self, count: int = 10) -> List[tuple]:
         """
@@ -174,9 +270,7 @@ class WordList:
         Returns:
             List[tuple]: List of (letter, frequency) tuples
         """
-        frequency = self.get_word_frequency()
-        sorted_letters = sorted(frequency.items(), key=lambda x: x[1], reverse=True)
-        return sorted_letters[:count]
+        return self._common_letters[:count]
     
     def __len__(self) -> int:
         """Return the number of words in the list."""
@@ -184,7 +278,7 @@ class WordList:
     
     def __contains__(self, word: str) -> bool:
         """Check if a word is in the list."""
-        return self.is_valid_word(word)
+        return isinstance(word, str) and word.strip().lower() in self.word_set
     
     def __iter__(self):
         """Iterate over the words in the list."""